@@ -66,10 +66,11 @@ def test_WarpImageMultiTransform_inputs():
         ),
     )
     inputs = WarpImageMultiTransform.input_spec()
+    all_traits = inputs.traits()
 
-    for key, metadata in list(input_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(inputs.traits()[key], metakey) == value
+    for key, metadata in input_map.items():
+        trait = all_traits[key]
+        assert {metakey: getattr(trait, metakey) for metakey in metadata} == metadata
 
 
 def test_WarpImageMultiTransform_outputs():
@@ -79,7 +80,8 @@ def test_WarpImageMultiTransform_outputs():
         ),
     )
     outputs = WarpImageMultiTransform.output_spec()
+    all_traits = outputs.traits()
 
-    for key, metadata in list(output_map.items()):
-        for metakey, value in list(metadata.items()):
-            assert getattr(outputs.traits()[key], metakey) == value
+    for key, metadata in output_map.items():
+        trait = all_traits[key]
+        assert {metakey: getattr(trait, metakey) for metakey in metadata} == metadata
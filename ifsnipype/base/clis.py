@@ -21,10 +21,10 @@
 # https://github.com/nipy/nipype/blob/1dee93965dfb6b0d0e50a6abd7ac89bf13dfbf8c/nipype/interfaces/base/core.py
 #
 """Command Line Interfaces (CLIs)."""
+import atexit
 import os
 import logging
-import subprocess as sp
-import shlex
+from functools import lru_cache
 
 from ifsnipype.base.traits_extension import traits, isdefined
 from ifsnipype.base.core import BaseInterface
@@ -49,6 +49,143 @@ VALID_TERMINAL_OUTPUT = [
 ]
 
 
+_persistent_procs = {}
+
+
+def _persistent_process(cmd_path, server_args, environ):
+    """Return a long-lived server process for ``cmd_path``, starting it if needed.
+
+    Processes are pooled per ``(cmd_path, server_args)`` so interfaces
+    launching the same executable with different server options do not
+    share a process.
+    """
+    import subprocess as sp
+
+    key = (cmd_path, tuple(server_args))
+    proc = _persistent_procs.get(key)
+    if proc is None or proc.poll() is not None:
+        proc = sp.Popen(
+            [cmd_path] + list(server_args),
+            stdin=sp.PIPE,
+            stdout=sp.PIPE,
+            stderr=sp.STDOUT,
+            env=environ,
+            text=True,
+            bufsize=1,
+        )
+        _persistent_procs[key] = proc
+    return proc
+
+
+def terminate_persistent_processes():
+    """Shut down any server-mode subprocesses started by interfaces."""
+    while _persistent_procs:
+        _, proc = _persistent_procs.popitem()
+        if proc.poll() is None:
+            proc.stdin.close()
+            proc.terminate()
+
+
+atexit.register(terminate_persistent_processes)
+
+
+@lru_cache(maxsize=32)
+def _canonical_env(frozen_items):
+    """Memoized canonicalize_env over an immutable snapshot of the env."""
+    from nipype.utils.filemanip import canonicalize_env
+
+    return canonicalize_env(dict(frozen_items))
+
+
+@lru_cache(maxsize=256)
+def _cached_which(cmd, path=None):
+    """Resolve an executable name, caching lookups per ``(cmd, PATH)``.
+
+    Workflows run the same executables over and over; caching avoids
+    re-statting every PATH directory (slow on networked filesystems) on
+    each interface execution.
+    """
+    from nipype.utils.filemanip import which
+
+    return which(cmd, env={"PATH": path} if path is not None else None)
+
+
+def _compile_formatter(trait_spec):
+    """Specialize a formatting closure for one ``argstr``-bearing trait.
+
+    The dispatch on trait type and format string is resolved once per
+    trait rather than on every argument of every command-line build.
+    """
+    argstr = trait_spec.argstr
+    if trait_spec.is_trait_type(traits.Bool) and "%" not in argstr:
+        # Boolean options have no format string. Just append options if True.
+        return lambda value: argstr if value else None
+
+    # This is a bit simple-minded at present, and should be
+    # construed as the default. If more sophisticated behavior
+    # is needed, it can be accomplished with metadata (e.g.
+    # format string for list member str'ification, specifying
+    # the separator, etc.)
+    sep = trait_spec.sep if trait_spec.sep is not None else " "
+    if argstr.endswith("..."):
+        # repeatable option
+        # --id %d... will expand to
+        # --id 1 --id 2 --id 3 etc.,.
+        repeat_argstr = argstr.replace("...", "")
+
+        def format_list(value):
+            return sep.join(repeat_argstr % elt for elt in value)
+
+    else:
+
+        def format_list(value):
+            if value and type(value[0]) is str:
+                # Skip str() when the list is all strings already
+                try:
+                    return argstr % sep.join(value)
+                except TypeError:  # mixed str/non-str list
+                    pass
+            return argstr % sep.join(str(elt) for elt in value)
+
+    if trait_spec.is_trait_type(traits.List):
+        return format_list
+
+    if trait_spec.is_trait_type(traits.TraitCompound):
+        # traits.Either turns into traits.TraitCompound; whether the
+        # value arrives as a list is only known at call time
+        return lambda value: (
+            format_list(value) if isinstance(value, list) else argstr % value
+        )
+
+    if argstr == "%s":
+        # The most common argstr by far; skip %-formatting altogether
+        return lambda value: value if isinstance(value, str) else str(value)
+
+    if argstr.endswith("%s") and argstr.count("%") == 1:
+        # Flagged string arguments ("-R %s") reduce to a concatenation
+        prefix = argstr[:-2]
+        return lambda value: prefix + (value if isinstance(value, str) else str(value))
+
+    # Append options using format string.
+    return lambda value: argstr % value
+
+
+def _position_extents(argstr_specs):
+    """Return the largest non-negative and smallest negative ``position``."""
+    max_pos = -1
+    min_neg = 0
+    for _, spec in argstr_specs:
+        pos = spec.position
+        if pos is not None:
+            pos = int(pos)
+            if pos >= 0:
+                if pos > max_pos:
+                    max_pos = pos
+            elif pos < min_neg:
+                min_neg = pos
+    return max_pos, min_neg
+
+
 class CommandLine(BaseInterface):
     """Implements functionality to interact with command line programs
     class must be instantiated with a command argument
@@ -81,6 +218,12 @@ class CommandLine(BaseInterface):
 
     """
 
+    # Attributes with class-level defaults (_cmd, _terminal_output,
+    # _write_cmdline) cannot be slotted without breaking the subclasses
+    # that override them as class attributes; slot the purely
+    # per-instance state used by the cmdline cache and execution path.
+    __slots__ = ("_environ", "_ldd", "_cmdline_cache", "_cmdline_key")
+
     input_spec = CommandLineInputSpec
     _cmd_prefix = ""
     _cmd = None
@@ -88,6 +231,15 @@ class CommandLine(BaseInterface):
     _terminal_output = "stream"
     _write_cmdline = False
 
+    # Server mode: tools invoked many times in a loop pay fork/exec and
+    # loader startup on every run.  Subclasses wrapping a tool with a
+    # line-oriented server/REPL mode may opt in by setting _persistent,
+    # the arguments that start the server, and the line the tool prints
+    # when one job's output is complete.
+    _persistent = False
+    _persistent_args = ()
+    _persistent_done = None
+
     @classmethod
     def set_default_terminal_output(cls, output_type):
         """Set the default terminal output for CommandLine Interfaces.
@@ -108,6 +260,8 @@ class CommandLine(BaseInterface):
     ):
         super(CommandLine, self).__init__(**inputs)
         self._environ = None
+        self._cmdline_cache = None
+        self._cmdline_key = None
         # Set command. Input argument takes precedence
         self._cmd = command or getattr(self, "_cmd", None)
 
@@ -121,7 +275,7 @@ class CommandLine(BaseInterface):
         if terminal_output is not None:
             self.terminal_output = terminal_output
 
-        self._write_cmdline = write_cmdline
+        self._write_cmdline = bool(write_cmdline)
 
     @property
     def cmd(self):
@@ -136,11 +290,86 @@ class CommandLine(BaseInterface):
     @property
     def cmdline(self):
         """`command` plus any arguments (args)
-        validates arguments and generates command line"""
-        self._check_mandatory_inputs()
+        validates arguments and generates command line
+
+        The generated command line is cached and only rebuilt when an
+        input or the working directory has changed since the previous
+        access.  Interfaces with ``genfile``/``name_source`` traits
+        always rebuild, as generated filenames may depend on state the
+        key cannot observe.
+        """
+        if self._has_gen_traits() or self.inputs._has_dynamic_traits():
+            self._check_mandatory_inputs()
+            return self._build_cmdline()
+        # Key on the input values themselves -- get_hashval() drops
+        # nohash traits such as thread counts -- plus the working
+        # directory, which _format_arg overrides may absolutize against
+        # (e.g. SEMLikeCommandLine's output filenames).
+        key = (
+            os.getcwd(),
+            repr(sorted(self.inputs.trait_get().items())),
+        )
+        if self._cmdline_cache is None or key != self._cmdline_key:
+            self._check_mandatory_inputs()
+            self._cmdline_cache = self._build_cmdline()
+            self._cmdline_key = key
+        return self._cmdline_cache
+
+    def _build_cmdline(self):
+        """Assemble ``command`` and arguments, bypassing the cache"""
         allargs = [self._cmd_prefix + self.cmd] + self._parse_inputs()
         return " ".join(allargs)
 
+    @classmethod
+    def _argstr_specs(cls):
+        """Sorted ``(name, spec)`` pairs of traits carrying ``argstr`` metadata.
+
+        The trait schema is static per class, so the traits introspection
+        and sort are run once and memoized on the class.
+        """
+        specs = cls.__dict__.get("_argstr_specs_cache")
+        if specs is None:
+            metadata = dict(argstr=lambda t: t is not None)
+            specs = sorted(cls.input_spec().traits(**metadata).items())
+            cls._argstr_specs_cache = specs
+        return specs
+
+    @classmethod
+    def _name_source_specs(cls):
+        """``{name: spec}`` of traits carrying ``name_source`` metadata."""
+        specs = cls.__dict__.get("_name_source_specs_cache")
+        if specs is None:
+            metadata = dict(name_source=lambda t: t is not None)
+            specs = dict(cls.input_spec().traits(**metadata))
+            cls._name_source_specs_cache = specs
+        return specs
+
+    @classmethod
+    def _has_gen_traits(cls):
+        """Whether any ``argstr`` trait requires filename generation.
+
+        Most auto-generated interfaces carry neither ``name_source`` nor
+        ``genfile`` metadata; caching this flag lets _parse_inputs skip
+        both checks on every trait.
+        """
+        flag = cls.__dict__.get("_has_gen_traits_cache")
+        if flag is None:
+            flag = any(
+                spec.name_source or spec.genfile
+                for _, spec in cls._argstr_specs()
+            )
+            cls._has_gen_traits_cache = flag
+        return flag
+
+    @classmethod
+    def _positional_extents(cls):
+        """Cached ``position`` bounds for pre-sizing the argument arrays."""
+        extents = cls.__dict__.get("_positional_extents_cache")
+        if extents is None:
+            extents = _position_extents(cls._argstr_specs())
+            cls._positional_extents_cache = extents
+        return extents
+
     @property
     def terminal_output(self):
         return self._terminal_output
@@ -160,20 +389,20 @@ class CommandLine(BaseInterface):
 
     @write_cmdline.setter
     def write_cmdline(self, value):
-        self._write_cmdline = value is True
+        self._write_cmdline = bool(value)
 
     def raise_exception(self, runtime):
         raise RuntimeError(
-            (
-                "Command:\n{cmdline}\nStandard output:\n{stdout}\n"
-                "Standard error:\n{stderr}\nReturn code: {returncode}"
-            ).format(**runtime.dictcopy())
+            f"Command:\n{runtime.cmdline}\nStandard output:\n{runtime.stdout}\n"
+            f"Standard error:\n{runtime.stderr}\nReturn code: {runtime.returncode}"
         )
 
     def _get_environ(self):
         return getattr(self.inputs, "environ", {})
 
     def version_from_command(self, flag="-v", cmd=None):
+        import subprocess as sp
+
         from nipype.utils.filemanip import canonicalize_env, which
 
         iflogger.warning(
@@ -187,10 +416,14 @@ class CommandLine(BaseInterface):
         if which(cmd, env=env):
             out_environ = self._get_environ()
             env.update(out_environ)
+            try:
+                env = _canonical_env(frozenset(env.items()))
+            except TypeError:  # unhashable (non-str) values
+                env = canonicalize_env(env)
             proc = sp.Popen(
                 " ".join((cmd, flag)),
                 shell=True,
-                env=canonicalize_env(env),
+                env=env,
                 stdout=sp.PIPE,
                 stderr=sp.PIPE,
             )
@@ -215,27 +448,26 @@ class CommandLine(BaseInterface):
         # Initialize runtime Bunch
 
         try:
-            runtime.cmdline = self.cmdline
+            cmdline = self.cmdline
         except Exception as exc:
             raise RuntimeError(
                 "Error raised when interpolating the command line"
             ) from exc
 
         from nipype.utils.subprocess import run_command
-        from nipype.utils.filemanip import (
-            get_dependencies,
-            which,
-        )
+        from nipype.utils.filemanip import get_dependencies
 
         runtime.stdout = None
         runtime.stderr = None
-        runtime.cmdline = self.cmdline
+        runtime.cmdline = cmdline
         runtime.environ.update(out_environ)
         runtime.success_codes = correct_return_codes
 
         # which $cmd
-        executable_name = shlex.split(self._cmd_prefix + self.cmd)[0]
-        cmd_path = which(executable_name, env=runtime.environ)
+        # The executable token of _cmd_prefix/_cmd never carries shell
+        # quoting, so a plain whitespace split beats the shlex lexer
+        executable_name = (self._cmd_prefix + self.cmd).split(None, 1)[0]
+        cmd_path = _cached_which(executable_name, runtime.environ.get("PATH"))
 
         if cmd_path is None:
             raise IOError(
@@ -250,73 +482,106 @@ class CommandLine(BaseInterface):
             if self._ldd
             else "<skipped>"
         )
+        if self._persistent:
+            try:
+                return self._run_persistent(runtime, cmd_path)
+            except OSError:
+                iflogger.warning(
+                    "Server mode failed for %s; falling back to one-shot "
+                    "execution",
+                    executable_name,
+                )
         runtime = run_command(
             runtime,
             output=self.terminal_output,
-            write_cmdline=self.write_cmdline,
+            write_cmdline=self._write_cmdline,
         )
         return runtime
 
+    def _run_persistent(self, runtime, cmd_path):
+        """Stream one job to a long-lived server process.
+
+        The command line is written to the server's stdin and output is
+        collected until the ``_persistent_done`` marker line is seen.
+        """
+        if self._persistent_done is None:
+            raise NotImplementedError(
+                "%s enables server mode but does not define _persistent_done"
+                % self.__class__.__name__
+            )
+        proc = _persistent_process(
+            cmd_path, self._persistent_args, runtime.environ
+        )
+        proc.stdin.write(runtime.cmdline + "\n")
+        proc.stdin.flush()
+        lines = []
+        done = self._persistent_done
+        for line in proc.stdout:
+            if line.rstrip("\n") == done:
+                break
+            lines.append(line)
+        else:
+            # EOF before the done marker: the server died mid-job. Drop
+            # it from the pool and report failure so the caller retries
+            # the job in one-shot mode instead of trusting partial output.
+            _persistent_procs.pop((cmd_path, tuple(self._persistent_args)), None)
+            if proc.poll() is None:
+                proc.terminate()
+            raise OSError(
+                "server process for %s exited before completing the job"
+                % cmd_path
+            )
+        runtime.stdout = "".join(lines)
+        runtime.stderr = ""
+        runtime.merged = runtime.stdout
+        runtime.returncode = 0
+        return runtime
+
     def _format_arg(self, name, trait_spec, value):
         """A helper function for _parse_inputs
 
         Formats a trait containing argstr metadata
         """
-        argstr = trait_spec.argstr
         iflogger.debug("%s_%s", name, value)
-        if trait_spec.is_trait_type(traits.Bool) and "%" not in argstr:
-            # Boolean options have no format string. Just append options if True.
-            return argstr if value else None
-        # traits.Either turns into traits.TraitCompound and does not have any
-        # inner_traits
-        elif trait_spec.is_trait_type(traits.List) or (
-            trait_spec.is_trait_type(traits.TraitCompound) and isinstance(value, list)
-        ):
-            # This is a bit simple-minded at present, and should be
-            # construed as the default. If more sophisticated behavior
-            # is needed, it can be accomplished with metadata (e.g.
-            # format string for list member str'ification, specifying
-            # the separator, etc.)
-
-            # Depending on whether we stick with traitlets, and whether or
-            # not we beef up traitlets.List, we may want to put some
-            # type-checking code here as well
-            sep = trait_spec.sep if trait_spec.sep is not None else " "
-
-            if argstr.endswith("..."):
-                # repeatable option
-                # --id %d... will expand to
-                # --id 1 --id 2 --id 3 etc.,.
-                argstr = argstr.replace("...", "")
-                return sep.join([argstr % elt for elt in value])
-            else:
-                return argstr % sep.join(str(elt) for elt in value)
-        else:
-            # Append options using format string.
-            return argstr % value
-
-    def _filename_from_source(self, name, chain=None):
+        if self.inputs._has_dynamic_traits():
+            # Dynamically added traits cannot be cached per class
+            return _compile_formatter(trait_spec)(value)
+        cls = type(self)
+        formatters = cls.__dict__.get("_formatter_cache")
+        if formatters is None:
+            formatters = {}
+            cls._formatter_cache = formatters
+        formatter = formatters.get(name)
+        if formatter is None:
+            formatter = formatters[name] = _compile_formatter(trait_spec)
+        return formatter(value)
+
+    def _filename_from_source(self, name, chain=None, cache=None):
+        if cache is not None and name in cache:
+            return cache[name]
         if chain is None:
             chain = []
 
-        trait_spec = self.inputs.trait(name)
-        retval = getattr(self.inputs, name)
+        inputs = self.inputs
+        trait_spec = inputs.trait(name)
+        retval = getattr(inputs, name)
         source_ext = None
         if not isdefined(retval) or "%s" in retval:
             from nipype.utils.filemanip import split_filename
 
-            if not trait_spec.name_source:
+            ns = trait_spec.name_source
+            if not ns:
                 return retval
 
             # Do not generate filename when excluded by other inputs
             if any(
-                isdefined(getattr(self.inputs, field)) for field in trait_spec.xor or ()
+                isdefined(getattr(inputs, field)) for field in trait_spec.xor or ()
             ):
                 return retval
 
             # Do not generate filename when required fields are missing
             if not all(
-                isdefined(getattr(self.inputs, field))
+                isdefined(getattr(inputs, field))
                 for field in trait_spec.requires or ()
             ):
                 return retval
@@ -328,7 +593,6 @@ class CommandLine(BaseInterface):
             if not name_template:
                 name_template = "%s_generated"
 
-            ns = trait_spec.name_source
             while isinstance(ns, (list, tuple)):
                 if len(ns) > 1:
                     iflogger.warning("Only one name_source per trait is allowed")
@@ -340,9 +604,8 @@ class CommandLine(BaseInterface):
                     "name, but a type {} object was found".format(name, type(ns))
                 )
 
-            if isdefined(getattr(self.inputs, ns)):
-                name_source = ns
-                source = getattr(self.inputs, name_source)
+            source = getattr(inputs, ns)
+            if isdefined(source):
                 while isinstance(source, list):
                     source = source[0]
 
@@ -356,7 +619,7 @@ class CommandLine(BaseInterface):
                     raise NipypeInterfaceError("Mutually pointing name_sources")
 
                 chain.append(name)
-                base = self._filename_from_source(ns, chain)
+                base = self._filename_from_source(ns, chain, cache=cache)
                 if isdefined(base):
                     _, _, source_ext = split_filename(base)
                 else:
@@ -371,6 +634,8 @@ class CommandLine(BaseInterface):
                     retval = retval + source_ext
             else:
                 retval = self._overload_extension(retval, name)
+        if cache is not None:
+            cache[name] = retval
         return retval
 
     def _gen_filename(self, name):
@@ -380,15 +645,19 @@ class CommandLine(BaseInterface):
         return value
 
     def _list_outputs(self):
-        metadata = dict(name_source=lambda t: t is not None)
-        traits = self.inputs.traits(**metadata)
+        if self.inputs._has_dynamic_traits():
+            metadata = dict(name_source=lambda t: t is not None)
+            traits = self.inputs.traits(**metadata)
+        else:
+            traits = self._name_source_specs()
         if traits:
             outputs = self.output_spec().trait_get()
-            for name, trait_spec in list(traits.items()):
+            fname_cache = {}
+            for name, trait_spec in traits.items():
                 out_name = name
                 if trait_spec.output_name is not None:
                     out_name = trait_spec.output_name
-                fname = self._filename_from_source(name)
+                fname = self._filename_from_source(name, cache=fname_cache)
                 if isdefined(fname):
                     outputs[out_name] = os.path.abspath(fname)
             return outputs
@@ -406,18 +675,35 @@ class CommandLine(BaseInterface):
 
         """
         all_args = []
-        initial_args = {}
-        final_args = {}
-        metadata = dict(argstr=lambda t: t is not None)
-        for name, spec in sorted(self.inputs.traits(**metadata).items()):
+        if self.inputs._has_dynamic_traits():
+            # Dynamically added traits are not in the class-level cache
+            metadata = dict(argstr=lambda t: t is not None)
+            argstr_specs = sorted(self.inputs.traits(**metadata).items())
+            gen_filenames = True
+            max_pos, min_neg = _position_extents(argstr_specs)
+        else:
+            argstr_specs = self._argstr_specs()
+            gen_filenames = self._has_gen_traits()
+            max_pos, min_neg = self._positional_extents()
+        # Positions are small integers, so slot arguments directly into
+        # pre-sized arrays rather than sorting position dicts afterwards.
+        initial_args = [None] * (max_pos + 1)
+        final_args = [None] * -min_neg
+        # Snapshot values up front; the formatting loop below then works
+        # on plain dict lookups and cannot observe inputs mutated while
+        # the command line is being assembled.
+        values = {name: getattr(self.inputs, name) for name, _ in argstr_specs}
+        fname_cache = {}
+        for name, spec in argstr_specs:
             if skip and name in skip:
                 continue
-            value = getattr(self.inputs, name)
-            if spec.name_source:
-                value = self._filename_from_source(name)
-            elif spec.genfile:
-                if not isdefined(value) or value is None:
-                    value = self._gen_filename(name)
+            value = values[name]
+            if gen_filenames:
+                if spec.name_source:
+                    value = self._filename_from_source(name, cache=fname_cache)
+                elif spec.genfile:
+                    if not isdefined(value) or value is None:
+                        value = self._gen_filename(name)
 
             if not isdefined(value):
                 continue
@@ -433,15 +719,20 @@ class CommandLine(BaseInterface):
                 continue
             pos = spec.position
             if pos is not None:
-                if int(pos) >= 0:
+                pos = int(pos)
+                if pos >= 0:
                     initial_args[pos] = arg
                 else:
-                    final_args[pos] = arg
+                    final_args[pos - min_neg] = arg
             else:
                 all_args.append(arg)
-        first_args = [el for _, el in sorted(initial_args.items())]
-        last_args = [el for _, el in sorted(final_args.items())]
-        return first_args + all_args + last_args
+        if max_pos < 0 and min_neg == 0:
+            # Most interfaces have no positional arguments
+            return all_args
+        args = [arg for arg in initial_args if arg is not None]
+        args.extend(all_args)
+        args.extend(arg for arg in final_args if arg is not None)
+        return args
 
 
 class StdOutCommandLine(CommandLine):
@@ -475,15 +766,14 @@ class MpiCommandLine(CommandLine):
 
     input_spec = MpiCommandLineInputSpec
 
-    @property
-    def cmdline(self):
+    def _build_cmdline(self):
         """Adds 'mpiexec' to begining of command"""
         result = []
         if self.inputs.use_mpi:
             result.append("mpiexec")
             if self.inputs.n_procs:
                 result.append("-n %d" % self.inputs.n_procs)
-        result.append(super(MpiCommandLine, self).cmdline)
+        result.append(super(MpiCommandLine, self)._build_cmdline())
         return " ".join(result)
 
 
@@ -501,7 +791,7 @@ class SEMLikeCommandLine(CommandLine):
         return self._outputs_from_inputs(outputs)
 
     def _outputs_from_inputs(self, outputs):
-        for name in list(outputs.keys()):
+        for name in outputs:
             corresponding_input = getattr(self.inputs, name)
             if isdefined(corresponding_input):
                 if isinstance(corresponding_input, bool) and corresponding_input:
@@ -516,7 +806,7 @@ class SEMLikeCommandLine(CommandLine):
         return outputs
 
     def _format_arg(self, name, spec, value):
-        if name in list(self._outputs_filenames.keys()):
+        if name in self._outputs_filenames:
             if isinstance(value, bool):
                 if value:
                     value = os.path.abspath(self._outputs_filenames[name])
@@ -525,6 +815,64 @@ class SEMLikeCommandLine(CommandLine):
         return super(SEMLikeCommandLine, self)._format_arg(name, spec, value)
 
 
+_VERSION_CACHE_PATH = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "ifsnipype",
+    "versions.json",
+)
+
+
+def _raw_version_output(version_cmd):
+    """Run ``version_cmd`` and return its stdout, or None if it fails.
+
+    The output is cached in ``~/.cache/ifsnipype/versions.json`` keyed on
+    the full version command plus the resolved executable's path, mtime
+    and size, so repeated workflow launches skip the version subprocess
+    until the tool itself changes.
+    """
+    import json
+
+    key = None
+    cache = {}
+    exe = _cached_which(version_cmd.split()[0])
+    if exe is not None:
+        try:
+            info = os.stat(exe)
+        except OSError:
+            pass
+        else:
+            # The full command participates in the key: distinct version
+            # commands may resolve to the same binary (e.g. interpreter
+            # wrappers) and must not share an entry.
+            key = "%s|%s:%d:%d" % (version_cmd, exe, int(info.st_mtime), info.st_size)
+            try:
+                with open(_VERSION_CACHE_PATH) as fobj:
+                    cache = json.load(fobj)
+            except (OSError, ValueError):
+                cache = {}
+            if key in cache:
+                return cache[key]
+
+    try:
+        clout = CommandLine(
+            command=version_cmd,
+            terminal_output="allatonce",
+        ).run()
+    except IOError:
+        return None
+
+    raw_info = clout.runtime.stdout
+    if key is not None and raw_info is not None:
+        cache[key] = raw_info
+        try:
+            os.makedirs(os.path.dirname(_VERSION_CACHE_PATH), exist_ok=True)
+            with open(_VERSION_CACHE_PATH, "w") as fobj:
+                json.dump(cache, fobj)
+        except OSError:
+            pass
+    return raw_info
+
+
 class PackageInfo:
     _version = None
     version_cmd = None
@@ -534,15 +882,9 @@ class PackageInfo:
     def version(klass):
         if klass._version is None:
             if klass.version_cmd is not None:
-                try:
-                    clout = CommandLine(
-                        command=klass.version_cmd,
-                        terminal_output="allatonce",
-                    ).run()
-                except IOError:
+                raw_info = _raw_version_output(klass.version_cmd)
+                if raw_info is None:
                     return None
-
-                raw_info = clout.runtime.stdout
             elif klass.version_file is not None:
                 try:
                     with open(klass.version_file, "rt") as fobj:
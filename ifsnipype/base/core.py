@@ -2,17 +2,22 @@
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 """Base interface definitions and infrastructure."""
 
-import os
 import logging
+from copy import deepcopy
 
-import simplejson as json
 from traits.trait_errors import TraitError
 
 from ifsnipype.base.traits_extension import isdefined, Undefined
 from ifsnipype.base.specs import BaseInterfaceInputSpec as _BaseInterfaceInputSpec
+from ifsnipype.base.specs import (
+    _check_mandatory_inputs,
+    _check_version_requirements,
+    load_inputs_from_json,
+)
 from ifsnipype.base.support import (
     RuntimeContext,
     InterfaceResult,
+    format_help,
 )
 
 _iflogger = logging.getLogger("nipype.interface")
@@ -27,6 +32,8 @@ class _Interface:
 
     """
 
+    __slots__ = ()
+
     _input_spec = None
     """
     The specification of the input, defined by a :py:class:`~traits.has_traits.HasTraits` class.
@@ -39,8 +46,6 @@ class _Interface:
     @classmethod
     def help(cls, returnhelp=False):
         """Prints class help"""
-        from ifsnipype.base.support import format_help
-
         allhelp = format_help(cls)
         if returnhelp:
             return allhelp
@@ -78,13 +83,20 @@ class BaseInterface(_Interface):
 
     """
 
+    # ``inputs`` is read on every hot path, so give it a slot; keep
+    # ``__dict__`` so the many subclasses that stash ad hoc state on
+    # instances continue to work, and ``__weakref__`` so interfaces stay
+    # weak-referenceable.
+    __slots__ = ("inputs", "__dict__", "__weakref__")
+
     input_spec = _BaseInterfaceInputSpec
+    output_spec = None
     _version = None
     _additional_metadata = []
     _redirect_x = False
     _references = []
 
-    def __init__(self, **inputs):
+    def __init__(self, from_file=None, **inputs):
         if not self.input_spec:
             raise Exception("No input_spec in class: %s" % self.__class__.__name__)
 
@@ -92,27 +104,49 @@ class BaseInterface(_Interface):
         # version, and then apply the inputs that were passed.
         self.inputs = self.input_spec()
 
-        # TODO: Consider version checking
-        # unavailable_traits = self._check_version_requirements(
-        #     self.inputs, permissive=True
-        # )
-        # if unavailable_traits:
-        #     self.inputs.trait_set(**{k: Undefined for k in unavailable_traits})
-        self.inputs.trait_set(**inputs)
+        unavailable_traits = self._check_version_requirements(
+            self.inputs, permissive=True
+        )
+        if unavailable_traits:
+            self.inputs.trait_set(**{k: Undefined for k in unavailable_traits})
+        # Values loaded from file are applied first so that explicit
+        # keyword inputs override them in a single trait_set pass
+        if from_file is not None:
+            load_inputs_from_json(self, from_file, overwrite=True)
+        if inputs:
+            self.inputs.trait_set(**inputs)
 
 
     def _outputs(self):
         """Returns a bunch containing output fields for the class"""
-        outputs = None
-        if self.output_spec:
-            outputs = self.output_spec()
+        if not self.output_spec:
+            return None
 
-        return outputs
+        # Constructing a spec re-runs the full traits default machinery;
+        # deep-copying a per-class prototype is measurably cheaper.
+        klass = self.__class__
+        proto = klass.__dict__.get("_outputs_prototype")
+        if proto is None or type(proto) is not self.output_spec:
+            proto = self.output_spec()
+            klass._outputs_prototype = proto
+        return deepcopy(proto)
 
     def _run_interface(self, runtime):
         """Core function that executes interface"""
         raise NotImplementedError
 
+    def _check_mandatory_inputs(self):
+        """Raise an error if a mandatory input is Undefined"""
+        _check_mandatory_inputs(self)
+
+    def _check_version_requirements(self, trait_object, permissive=False):
+        """List traits unavailable at the wrapped tool's current version.
+
+        The underlying scan is memoized per ``(spec class, version)``, so
+        repeated instantiation of an interface costs a dict lookup.
+        """
+        return _check_version_requirements(self, trait_object, permissive=permissive)
+
     # TODO: Consider duecredit dependency
     # def _duecredit_cite(self):
     #     """Add the interface references to the duecredit citations"""
@@ -138,19 +172,17 @@ class BaseInterface(_Interface):
             if successful, results
 
         """
-        # TODO: Remove nipype dependency on indirectory
-        from nipype.utils.filemanip import indirectory
         rtc = RuntimeContext(ignore_exception=bool(ignore_exception))
 
-        with indirectory(cwd or os.getcwd()):
-            self.inputs.trait_set(**inputs)
-        # TODO: enable check
-        # self._check_mandatory_inputs()
-
-        # TODO: Version checking?
-        # self._check_version_requirements(self.inputs)
-
         with rtc(self, cwd=cwd, redirect_x=self._redirect_x) as runtime:
+            # Inputs are applied after the working directory is switched
+            # so relative paths validate against ``cwd``
+            if inputs:
+                self.inputs.trait_set(**inputs)
+            # TODO: enable check
+            # self._check_mandatory_inputs()
+
+            self._check_version_requirements(self.inputs)
 
             # Grab inputs now, as they should not change during execution
             inputs = self.inputs.get_traitsfree()
@@ -194,13 +226,12 @@ class BaseInterface(_Interface):
             return outputs
 
         # Precalculate the list of output trait names that should be aggregated
-        aggregate_names = set(predicted_outputs)
+        aggregate_names = predicted_outputs.keys()
         if needed_outputs is not None:
-            aggregate_names = set(needed_outputs).intersection(aggregate_names)
+            aggregate_names = aggregate_names & needed_outputs
 
         if aggregate_names:  # Make sure outputs are compatible
-            _na_outputs = self._check_version_requirements(outputs)
-            na_names = aggregate_names.intersection(_na_outputs)
+            na_names = aggregate_names & set(self._check_version_requirements(outputs))
             if na_names:
                 # XXX Change to TypeError in Nipype 2.0
                 raise KeyError(
@@ -210,23 +241,28 @@ Output trait(s) %s not available in version %s of interface %s.\
                     % (", ".join(na_names), self.version, self.__class__.__name__)
                 )
 
-        for key in aggregate_names:  # Final aggregation
-            val = predicted_outputs[key]
-            try:
-                setattr(outputs, key, val)
-            except TraitError as error:
-                if "an existing" in getattr(error, "info", "default"):
-                    msg = (
-                        "No such file or directory '%s' for output '%s' of a %s interface"
-                        % (val, key, self.__class__.__name__)
-                    )
-                    raise FileNotFoundError(msg)
-                raise error
+        # Final aggregation: validate the batch in one trait_set call and
+        # fall back to per-key assignment only to identify a failure
+        batch = {key: predicted_outputs[key] for key in aggregate_names}
+        try:
+            outputs.trait_set(**batch)
+        except TraitError:
+            for key, val in batch.items():
+                try:
+                    setattr(outputs, key, val)
+                except TraitError as error:
+                    if "an existing" in getattr(error, "info", "default"):
+                        msg = (
+                            "No such file or directory '%s' for output '%s' of a %s interface"
+                            % (val, key, self.__class__.__name__)
+                        )
+                        raise FileNotFoundError(msg)
+                    raise error
         return outputs
 
-    # @property
-    # def version(self):
-    #     return self._version
+    @property
+    def version(self):
+        return self._version
 
     def _pre_run_hook(self, runtime):
         """
@@ -291,6 +327,8 @@ class SimpleInterface(BaseInterface):
 
     """
 
+    __slots__ = ("_results",)
+
     def __init__(self, **inputs):
         super().__init__(**inputs)
         self._results = {}
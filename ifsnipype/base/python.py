@@ -22,12 +22,34 @@
 #
 """Python library interface base."""
 import logging
+from functools import lru_cache
+
 from ifsnipype.base.core import BaseInterface
 
 
 iflogger = logging.getLogger("nipype.interface")
 
 
+@lru_cache(maxsize=None)
+def _failed_imports(packages):
+    """Subset of ``packages`` that cannot be found on ``sys.path``.
+
+    Locating a package stats its way across ``sys.path``, so the probe
+    is run once per package tuple rather than per instance.
+    """
+    from importlib.util import find_spec
+
+    failed = []
+    for pkg in packages:
+        try:
+            found = find_spec(pkg) is not None
+        except (ImportError, ValueError):
+            found = False
+        if not found:
+            failed.append(pkg)
+    return tuple(failed)
+
+
 class LibraryBaseInterface(BaseInterface):
     _pkg = None
     imports = ()
@@ -35,26 +57,30 @@ class LibraryBaseInterface(BaseInterface):
     def __init__(self, check_import=True, *args, **kwargs):
         super(LibraryBaseInterface, self).__init__(*args, **kwargs)
         if check_import:
-            import pkgutil
-
-            failed_imports = []
-            for pkg in (self._pkg,) + tuple(self.imports):
-                if pkgutil.find_loader(pkg) is None:
-                    failed_imports.append(pkg)
+            failed_imports = _failed_imports((self._pkg,) + tuple(self.imports))
             if failed_imports:
                 iflogger.warning(
                     "Unable to import %s; %s interface may fail to " "run",
-                    failed_imports,
+                    list(failed_imports),
                     self.__class__.__name__,
                 )
 
     @property
     def version(self):
-        if self._version is None:
-            import importlib
+        klass = self.__class__
+        if klass.__dict__.get("_version") is None:
+            # Resolve once per class; prefer distribution metadata, which
+            # does not import the (potentially heavy) package itself.
+            from importlib.metadata import PackageNotFoundError
+            from importlib.metadata import version as pkg_version
 
             try:
-                self._version = importlib.import_module(self._pkg).__version__
-            except (ImportError, AttributeError):
-                pass
-        return super(LibraryBaseInterface, self).version
+                klass._version = pkg_version(self._pkg)
+            except PackageNotFoundError:
+                import importlib
+
+                try:
+                    klass._version = importlib.import_module(self._pkg).__version__
+                except (ImportError, AttributeError):
+                    pass
+        return self._version
@@ -10,11 +10,14 @@ Define the API for the I/O of interfaces
 
 """
 import os
+import logging
+from functools import lru_cache
 from inspect import isclass
 from copy import deepcopy
 from warnings import warn
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 
+from traits.trait_base import _Undefined
 from traits.trait_errors import TraitError
 from traits.trait_handlers import TraitDictObject, TraitListObject
 
@@ -31,6 +34,41 @@ from ifsnipype.base.traits_extension import (
 
 _float_fmt = "{:.10f}".format
 
+_iflogger = logging.getLogger("nipype.interface")
+
+# Container type tuples for the value walkers below.  The Trait*Object
+# classes subclass dict/list, so one isinstance call per category covers
+# both the traited and plain representations.
+_DICT_TYPES = (dict, TraitDictObject)
+_SEQ_TYPES = (list, tuple, TraitListObject)
+
+# Value types that are safe to share between a spec and its deep copy.
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, type(None), _Undefined)
+
+# Metadata filters for trait_names(); shared so the cache-fill path does
+# not allocate a fresh dict and closure per lookup.
+_XOR_FILTER = {"xor": lambda t: t is not None}
+_DEPRECATED_FILTER = {"deprecated": lambda t: t is not None}
+_COPYFILE_FILTER = {"copyfile": lambda t: t is not None}
+
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(objekt):
+        return orjson.dumps(objekt, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(objekt):
+        return json.dumps(objekt, indent=4, ensure_ascii=False)
+
 
 class BaseTraitedSpec(traits.HasTraits):
     """
@@ -63,37 +101,111 @@ class BaseTraitedSpec(traits.HasTraits):
         # super(TraitedSpec, self).__init__(*args, **kwargs)
         super(BaseTraitedSpec, self).__init__(**kwargs)
         traits.push_exception_handler(reraise_exceptions=True)
-        undefined_traits = {}
-        for trait in self.copyable_trait_names():
-            if not self.traits()[trait].usedefault:
-                undefined_traits[trait] = Undefined
-        self.trait_set(trait_change_notify=False, **undefined_traits)
+        # The prebuilt dict is shared per class; ** unpacking copies it,
+        # so trait_set cannot mutate the cached original
+        undefined_traits = self._class_trait_info()["undefined_defaults"]
+        if undefined_traits:
+            self.trait_set(trait_change_notify=False, **undefined_traits)
         self._generate_handlers()
         self.trait_set(**kwargs)
 
+    def _class_trait_info(self):
+        """Precomputed trait metadata, shared by all instances of a class.
+
+        The trait schema is fixed per class, so the name lists and trait
+        table that __init__, items() and the hashing helpers need are
+        collected once instead of re-walking the HasTraits metadata on
+        every instantiation.  Only class-level traits are covered;
+        callers dealing with dynamically added traits must check
+        ``self._has_dynamic_traits()`` first.
+        """
+        cls = type(self)
+        info = cls.__dict__.get("_trait_info_cache")
+        if info is None:
+            all_traits = dict(self.traits())
+            copyable = tuple(self.copyable_trait_names())
+            info = {
+                "traits": all_traits,
+                "copyable": copyable,
+                "sorted_copyable": tuple(sorted(copyable)),
+                "undefined_defaults": dict.fromkeys(
+                    (name for name in copyable if not all_traits[name].usedefault),
+                    Undefined,
+                ),
+                "output_multi_object": tuple(
+                    name
+                    for name in copyable
+                    if all_traits[name].is_trait_type(OutputMultiObject)
+                ),
+                "nohash": frozenset(
+                    name
+                    for name, trait in all_traits.items()
+                    if has_metadata(trait.trait_type, "nohash", True)
+                ),
+                "no_hash_files": frozenset(
+                    name
+                    for name, trait in all_traits.items()
+                    if has_metadata(trait.trait_type, "hash_files", False)
+                ),
+                "name_source": frozenset(
+                    name
+                    for name, trait in all_traits.items()
+                    if has_metadata(trait.trait_type, "name_source")
+                ),
+                "xors": tuple(self.trait_names(**_XOR_FILTER)),
+                "deprecated": tuple(self.trait_names(**_DEPRECATED_FILTER)),
+            }
+            cls._trait_info_cache = info
+        return info
+
+    def _has_dynamic_traits(self):
+        """Whether traits beyond the class schema were added at run time.
+
+        ``on_trait_change`` clones class traits into the instance trait
+        dictionary when ``_generate_handlers`` attaches ``xor`` and
+        ``deprecated`` notifiers, so a non-empty ``_instance_traits()``
+        does not mean the schema changed.  Only names absent from the
+        class schema disqualify the per-class caches.
+        """
+        instance_traits = self._instance_traits()
+        if not instance_traits:
+            return False
+        cls = type(self)
+        names = cls.__dict__.get("_class_trait_names_cache")
+        if names is None:
+            names = frozenset(cls.class_trait_names())
+            cls._class_trait_names_cache = names
+        return not names.issuperset(instance_traits)
+
     def items(self):
         """Name, trait generator for user modifiable traits"""
-        for name in sorted(self.copyable_trait_names()):
-            yield name, self.traits()[name]
+        if self._has_dynamic_traits():
+            all_traits = self.traits()
+            for name in sorted(self.copyable_trait_names()):
+                yield name, all_traits[name]
+            return
+        info = self._class_trait_info()
+        all_traits = info["traits"]
+        for name in info["sorted_copyable"]:
+            yield name, all_traits[name]
 
     def __repr__(self):
         """Return a well-formatted representation of the traits"""
-        outstr = []
-        for name, value in sorted(self.trait_get().items()):
-            outstr.append("%s = %s" % (name, value))
-        return "\n{}\n".format("\n".join(outstr))
+        if self._has_dynamic_traits():
+            names = sorted(self.trait_get())
+        else:
+            names = self._class_trait_info()["sorted_copyable"]
+        body = "\n".join(f"{name} = {getattr(self, name)}" for name in names)
+        return f"\n{body}\n"
 
     def _generate_handlers(self):
         """Find all traits with the 'xor' metadata and attach an event
         handler to them.
         """
-        has_xor = dict(xor=lambda t: t is not None)
-        xors = self.trait_names(**has_xor)
-        for elem in xors:
+        info = self._class_trait_info()
+        for elem in info["xors"]:
             self.on_trait_change(self._xor_warn, elem)
-        has_deprecation = dict(deprecated=lambda t: t is not None)
-        deprecated = self.trait_names(**has_deprecation)
-        for elem in deprecated:
+        for elem in info["deprecated"]:
             self.on_trait_change(self._deprecated_warn, elem)
 
     def _xor_warn(self, obj, name, old, new):
@@ -106,49 +218,50 @@ class BaseTraitedSpec(traits.HasTraits):
                     # skip ourself
                     continue
                 if isdefined(getattr(self, trait_name)):
-                    self.trait_set(
-                        trait_change_notify=False, **{"%s" % name: Undefined}
+                    self.trait_set(trait_change_notify=False, **{name: Undefined})
+                    raise IOError(
+                        f'Input "{name}" is mutually exclusive with input '
+                        f'"{trait_name}", which is already set'
                     )
-                    msg = (
-                        'Input "%s" is mutually exclusive with input "%s", '
-                        "which is already set"
-                    ) % (name, trait_name)
-                    raise IOError(msg)
 
     def _deprecated_warn(self, obj, name, old, new):
         """Checks if a user assigns a value to a deprecated trait"""
         if isdefined(new):
             trait_spec = self.traits()[name]
-            msg1 = "Input %s in interface %s is deprecated." % (
-                name,
-                self.__class__.__name__.split("InputSpec")[0],
-            )
+            # Parse the deprecation bound once; the CTrait carries the
+            # cached Version as ad hoc metadata across assignments.
+            deprecated_ver = trait_spec._deprecated_version
+            if deprecated_ver is None:
+                deprecated_ver = Version(str(trait_spec.deprecated))
+                trait_spec._deprecated_version = deprecated_ver
+            interface = self.__class__.__name__.split("InputSpec")[0]
+            msg1 = f"Input {name} in interface {interface} is deprecated."
             msg2 = (
-                "Will be removed or raise an error as of release %s"
-                % trait_spec.deprecated
+                "Will be removed or raise an error as of release "
+                f"{trait_spec.deprecated}"
             )
             if trait_spec.new_name:
                 if trait_spec.new_name not in self.copyable_trait_names():
                     raise TraitError(
-                        msg1 + " Replacement trait %s not found" % trait_spec.new_name
+                        msg1 + f" Replacement trait {trait_spec.new_name} not found"
                     )
-                msg3 = "It has been replaced by %s." % trait_spec.new_name
+                msg3 = f"It has been replaced by {trait_spec.new_name}."
             else:
                 msg3 = ""
             msg = " ".join((msg1, msg2, msg3))
-            if Version(str(trait_spec.deprecated)) < self.package_version:
+            if deprecated_ver < self.package_version:
                 raise TraitError(msg)
             else:
                 if trait_spec.new_name:
-                    msg += "Unsetting old value %s; setting new value %s." % (
-                        name,
-                        trait_spec.new_name,
+                    msg += (
+                        f"Unsetting old value {name}; "
+                        f"setting new value {trait_spec.new_name}."
                     )
                 warn(msg)
                 if trait_spec.new_name:
                     self.trait_set(
                         trait_change_notify=False,
-                        **{"%s" % name: Undefined, "%s" % trait_spec.new_name: new}
+                        **{name: Undefined, trait_spec.new_name: new},
                     )
 
     def trait_get(self, **kwargs):
@@ -175,38 +288,36 @@ class BaseTraitedSpec(traits.HasTraits):
         return out
 
     def _clean_container(self, objekt, undefinedval=None, skipundefined=False):
-        """Convert a traited obejct into a pure python representation."""
-        if isinstance(objekt, TraitDictObject) or isinstance(objekt, dict):
+        """Convert a traited obejct into a pure python representation.
+
+        Note that ``skipundefined`` intentionally only applies to the
+        top-level container, matching the behavior relied upon by
+        :meth:`get_traitsfree`.
+
+        The ``isinstance(..., _Undefined)`` checks inline :func:`isdefined`
+        to avoid a function call per visited value.
+        """
+        clean = self._clean_container
+        if isinstance(objekt, _DICT_TYPES):
             out = {}
-            for key, val in list(objekt.items()):
-                if isdefined(val):
-                    out[key] = self._clean_container(val, undefinedval)
-                else:
-                    if not skipundefined:
-                        out[key] = undefinedval
-        elif (
-            isinstance(objekt, TraitListObject)
-            or isinstance(objekt, list)
-            or isinstance(objekt, tuple)
-        ):
+            for key, val in objekt.items():
+                if not isinstance(val, _Undefined):
+                    out[key] = clean(val, undefinedval)
+                elif not skipundefined:
+                    out[key] = undefinedval
+        elif isinstance(objekt, _SEQ_TYPES):
             out = []
             for val in objekt:
-                if isdefined(val):
-                    out.append(self._clean_container(val, undefinedval))
+                if not isinstance(val, _Undefined):
+                    out.append(clean(val, undefinedval))
                 else:
-                    if not skipundefined:
-                        out.append(undefinedval)
-                    else:
-                        out.append(None)
+                    out.append(None if skipundefined else undefinedval)
             if isinstance(objekt, tuple):
                 out = tuple(out)
+        elif not isinstance(objekt, _Undefined):
+            out = objekt
         else:
-            out = None
-            if isdefined(objekt):
-                out = objekt
-            else:
-                if not skipundefined:
-                    out = undefinedval
+            out = None if skipundefined else undefinedval
         return out
 
     def has_metadata(self, name, metadata, value=None, recursive=True):
@@ -236,96 +347,46 @@ class BaseTraitedSpec(traits.HasTraits):
             The md5 hash value of the traited spec
 
         """
-        from nipype.utils.filemanip import md5
-
         list_withhash = []
         list_nofilename = []
-        for name, val in sorted(self.trait_get().items()):
-            if not isdefined(val) or self.has_metadata(name, "nohash", True):
+        if self._has_dynamic_traits():
+            # Dynamic traits are not covered by the class cache; probe the
+            # metadata live for this (rare) kind of spec.
+            for name in sorted(self.trait_get()):
+                val = getattr(self, name)
+                if isinstance(val, _Undefined) or self.has_metadata(
+                    name, "nohash", True
+                ):
+                    continue
+                hash_files = not self.has_metadata(
+                    name, "hash_files", False
+                ) and not self.has_metadata(name, "name_source")
+                withhash, nofilename = _sorted_views(val, hash_method, hash_files)
+                list_withhash.append((name, withhash))
+                list_nofilename.append((name, nofilename))
+            return list_withhash, _digest_pairs(list_nofilename)
+
+        info = self._class_trait_info()
+        nohash = info["nohash"]
+        no_hash_files = info["no_hash_files"]
+        name_source = info["name_source"]
+        for name in info["sorted_copyable"]:
+            val = getattr(self, name)
+            if name in nohash or isinstance(val, _Undefined):
                 # skip undefined traits and traits with nohash=True
                 continue
 
-            hash_files = not self.has_metadata(
-                name, "hash_files", False
-            ) and not self.has_metadata(name, "name_source")
-            list_nofilename.append(
-                (
-                    name,
-                    self._get_sorteddict(
-                        val, hash_method=hash_method, hash_files=hash_files
-                    ),
-                )
-            )
-            list_withhash.append(
-                (
-                    name,
-                    self._get_sorteddict(
-                        val, True, hash_method=hash_method, hash_files=hash_files
-                    ),
-                )
-            )
-        return list_withhash, md5(str(list_nofilename).encode()).hexdigest()
+            hash_files = name not in no_hash_files and name not in name_source
+            withhash, nofilename = _sorted_views(val, hash_method, hash_files)
+            list_withhash.append((name, withhash))
+            list_nofilename.append((name, nofilename))
+        return list_withhash, _digest_pairs(list_nofilename)
 
     def _get_sorteddict(
         self, objekt, dictwithhash=False, hash_method="timestamp", hash_files=True
     ):
-        from nipype.utils.filemanip import hash_infile, hash_timestamp
-
-        if isinstance(objekt, dict):
-            out = []
-            for key, val in sorted(objekt.items()):
-                if isdefined(val):
-                    out.append(
-                        (
-                            key,
-                            self._get_sorteddict(
-                                val,
-                                dictwithhash,
-                                hash_method=hash_method,
-                                hash_files=hash_files,
-                            ),
-                        )
-                    )
-        elif isinstance(objekt, (list, tuple)):
-            out = []
-            for val in objekt:
-                if isdefined(val):
-                    out.append(
-                        self._get_sorteddict(
-                            val,
-                            dictwithhash,
-                            hash_method=hash_method,
-                            hash_files=hash_files,
-                        )
-                    )
-            if isinstance(objekt, tuple):
-                out = tuple(out)
-        else:
-            out = None
-            if isdefined(objekt):
-                if (
-                    hash_files
-                    and isinstance(objekt, (str, bytes))
-                    and os.path.isfile(objekt)
-                ):
-                    # if hash_method is None:
-                    #     hash_method = config.get("execution", "hash_method")
-
-                    if hash_method.lower() == "timestamp":
-                        hash = hash_timestamp(objekt)
-                    elif hash_method.lower() == "content":
-                        hash = hash_infile(objekt)
-                    else:
-                        raise Exception("Unknown hash method: %s" % hash_method)
-                    if dictwithhash:
-                        out = (objekt, hash)
-                    else:
-                        out = hash
-                elif isinstance(objekt, float):
-                    out = _float_fmt(objekt)
-                else:
-                    out = objekt
-        return out
+        with_hash, no_filename = _sorted_views(objekt, hash_method, hash_files)
+        return with_hash if dictwithhash else no_filename
 
     @property
     def __all__(self):
@@ -351,10 +412,15 @@ class BaseTraitedSpec(traits.HasTraits):
 
         """
         state = super(BaseTraitedSpec, self).__getstate__()
-        for key in self.__all__:
-            _trait_spec = self.trait(key)
-            if _trait_spec.is_trait_type(OutputMultiObject):
-                state[key] = _trait_spec.handler.get_value(self, key)
+        if self._has_dynamic_traits():
+            # Dynamic traits are invisible to the class cache; probe live
+            for key in self.__all__:
+                _trait_spec = self.trait(key)
+                if _trait_spec.is_trait_type(OutputMultiObject):
+                    state[key] = _trait_spec.handler.get_value(self, key)
+            return state
+        for key in self._class_trait_info()["output_multi_object"]:
+            state[key] = self.trait(key).handler.get_value(self, key)
         return state
 
 
@@ -387,19 +453,13 @@ class DynamicTraitedSpec(BaseTraitedSpec):
         id_self = id(self)
         if id_self in memo:
             return memo[id_self]
-        dup_dict = deepcopy(self.trait_get(), memo)
-        # access all keys
-        for key in self.copyable_trait_names():
-            if key in self.__dict__.keys():
-                _ = getattr(self, key)
-        # clone once
-        dup = self.clone_traits(memo=memo)
-        for key in self.copyable_trait_names():
-            try:
-                _ = getattr(dup, key)
-            except:
-                pass
-        # clone twice
+        # Known-immutable values are safe to carry over by reference;
+        # anything else (containers, arrays, arbitrary objects) could leak
+        # shared mutable state between the copies.
+        dup_dict = {
+            key: value if isinstance(value, _IMMUTABLE_TYPES) else deepcopy(value, memo)
+            for key, value in self.trait_get().items()
+        }
         dup = self.clone_traits(memo=memo)
         dup.trait_set(**dup_dict)
         return dup
@@ -427,83 +487,233 @@ class MpiCommandLineInputSpec(CommandLineInputSpec):
     )
 
 
-def get_filecopy_info(cls):
-    """Provides information about file inputs to copy or link to cwd.
-    Necessary for pipeline operation
-    """
-    if cls.input_spec is None:
-        return None
-
-    # normalize_filenames is not a classmethod, hence check first
-    if not isclass(cls) and hasattr(cls, "normalize_filenames"):
-        cls.normalize_filenames()
-    info = []
-    inputs = cls.input_spec() if isclass(cls) else cls.inputs
-    metadata = dict(copyfile=lambda t: t is not None)
-    for name, spec in sorted(inputs.traits(**metadata).items()):
-        info.append(dict(key=name, copy=spec.copyfile))
-    return info
-
-
 def _check_requires(obj, spec, name, value):
     """check if required inputs are satisfied"""
-    if spec.requires:
-        values = [
-            not isdefined(getattr(obj.inputs, field)) for field in spec.requires
-        ]
-        if any(values) and isdefined(value):
-            if len(values) > 1:
-                fmt = (
-                    "%s requires values for inputs %s because '%s' is set. "
-                    "For a list of required inputs, see %s.help()"
-                )
-            else:
-                fmt = (
-                    "%s requires a value for input %s because '%s' is set. "
-                    "For a list of required inputs, see %s.help()"
-                )
-            msg = fmt % (
-                obj.__class__.__name__,
-                ", ".join("'%s'" % req for req in spec.requires),
-                name,
-                obj.__class__.__name__,
+    requires = spec.requires
+    if requires and isdefined(value):
+        inputs = obj.inputs
+        if any(not isdefined(getattr(inputs, field)) for field in requires):
+            cls_name = obj.__class__.__name__
+            noun = "values for inputs" if len(requires) > 1 else "a value for input"
+            joined = ", ".join(f"'{req}'" for req in requires)
+            raise ValueError(
+                f"{cls_name} requires {noun} {joined} because '{name}' is set. "
+                f"For a list of required inputs, see {cls_name}.help()"
             )
-            raise ValueError(msg)
 
 def _check_xor(obj, spec, name, value):
     """check if mutually exclusive inputs are satisfied"""
-    if spec.xor:
-        values = [isdefined(getattr(obj.inputs, field)) for field in spec.xor]
-        if not any(values) and not isdefined(value):
-            msg = (
-                "%s requires a value for one of the inputs '%s'. "
-                "For a list of required inputs, see %s.help()"
-                % (
-                    obj.__class__.__name__,
-                    ", ".join(spec.xor),
-                    obj.__class__.__name__,
-                )
+    if spec.xor and not isdefined(value):
+        inputs = obj.inputs
+        if not any(isdefined(getattr(inputs, field)) for field in spec.xor):
+            cls_name = obj.__class__.__name__
+            raise ValueError(
+                f"{cls_name} requires a value for one of the inputs "
+                f"'{', '.join(spec.xor)}'. "
+                f"For a list of required inputs, see {cls_name}.help()"
             )
-            raise ValueError(msg)
+
+def _scan_mandatory_traits(trait_object):
+    """Collect the traits _check_mandatory_inputs needs to inspect.
+
+    One walk over the trait table replaces the two filtered ``traits()``
+    scans (``mandatory=True`` and ``mandatory=None, transient=None``).
+    """
+    mandatory = []
+    requiring = []
+    for name, spec in trait_object.traits().items():
+        if spec.mandatory:
+            mandatory.append((name, spec))
+        elif spec.mandatory is None and spec.transient is None and spec.requires:
+            requiring.append((name, spec))
+    return tuple(mandatory), tuple(requiring)
+
+
+@lru_cache(maxsize=None)
+def _mandatory_check_traits(spec_cls):
+    """Memoized mandatory/requires trait lists for one spec class."""
+    return _scan_mandatory_traits(spec_cls())
+
 
 def _check_mandatory_inputs(obj):
     """Raises an exception if a mandatory input is Undefined"""
-    for name, spec in list(obj.inputs.traits(mandatory=True).items()):
-        value = getattr(obj.inputs, name)
+    inputs = obj.inputs
+    if inputs._has_dynamic_traits():
+        # Dynamically added traits are invisible to the class-keyed cache
+        mandatory, requiring = _scan_mandatory_traits(inputs)
+    else:
+        mandatory, requiring = _mandatory_check_traits(type(inputs))
+    for name, spec in mandatory:
+        value = getattr(inputs, name)
         _check_xor(obj, spec, name, value)
         if not isdefined(value) and spec.xor is None:
-            msg = (
-                "%s requires a value for input '%s'. "
-                "For a list of required inputs, see %s.help()"
-                % (obj.__class__.__name__, name, obj.__class__.__name__)
+            cls_name = obj.__class__.__name__
+            raise ValueError(
+                f"{cls_name} requires a value for input '{name}'. "
+                f"For a list of required inputs, see {cls_name}.help()"
             )
-            raise ValueError(msg)
         if isdefined(value):
             _check_requires(obj, spec, name, value)
-    for name, spec in list(
-        obj.inputs.traits(mandatory=None, transient=None).items()
-    ):
-        obj._check_requires(obj, spec, name, getattr(obj.inputs, name))
+    for name, spec in requiring:
+        _check_requires(obj, spec, name, getattr(inputs, name))
+
+def _digest_pairs(pairs):
+    """MD5 of ``str(pairs)`` without materializing the full string.
+
+    Feeding the hash per pair keeps peak memory at one trait's repr
+    instead of the whole spec's.  The byte stream matches
+    ``str(list(pairs)).encode()`` exactly, so digests are unchanged.
+    """
+    from nipype.utils.filemanip import md5
+
+    h = md5()
+    h.update(b"[")
+    sep = b""
+    for pair in pairs:
+        h.update(sep)
+        h.update(repr(pair).encode())
+        sep = b", "
+    h.update(b"]")
+    return h.hexdigest()
+
+
+_FILE_HASH_CACHE = {}
+
+
+def _hash_file(path, hash_method):
+    """Hash one existing file, memoized on ``(realpath, method, mtime, size)``.
+
+    Pipeline hashing visits the same files from many interfaces; the
+    cache avoids re-reading (or re-statting) them until they change.
+    """
+    from nipype.utils.filemanip import hash_infile, hash_timestamp
+
+    method = "timestamp" if hash_method is None else hash_method.lower()
+    if method not in ("timestamp", "content"):
+        raise Exception("Unknown hash method: %s" % hash_method)
+    real = os.path.realpath(path)
+    try:
+        info = os.stat(real)
+    except OSError:
+        key = None
+    else:
+        key = (real, method, info.st_mtime_ns, info.st_size)
+        cached = _FILE_HASH_CACHE.get(key)
+        if cached is not None:
+            return cached
+    value = hash_timestamp(path) if method == "timestamp" else hash_infile(path)
+    if key is not None:
+        _FILE_HASH_CACHE[key] = value
+    return value
+
+
+def _sorted_views(objekt, hash_method, hash_files):
+    """Build the with-hash and no-filename views of a value in one walk.
+
+    ``isinstance(..., _Undefined)`` inlines :func:`isdefined`, sparing a
+    function call per visited value.
+    """
+    if isinstance(objekt, _DICT_TYPES):
+        with_hash = []
+        no_filename = []
+        for key, val in sorted(objekt.items()):
+            if not isinstance(val, _Undefined):
+                w, n = _sorted_views(val, hash_method, hash_files)
+                with_hash.append((key, w))
+                no_filename.append((key, n))
+        return with_hash, no_filename
+    if isinstance(objekt, _SEQ_TYPES):
+        with_hash = []
+        no_filename = []
+        for val in objekt:
+            if not isinstance(val, _Undefined):
+                w, n = _sorted_views(val, hash_method, hash_files)
+                with_hash.append(w)
+                no_filename.append(n)
+        if isinstance(objekt, tuple):
+            return tuple(with_hash), tuple(no_filename)
+        return with_hash, no_filename
+    out = None
+    if not isinstance(objekt, _Undefined):
+        if hash_files and isinstance(objekt, (str, bytes)) and os.path.isfile(objekt):
+            hash = _hash_file(objekt, hash_method)
+            return (objekt, hash), hash
+        if isinstance(objekt, float):
+            out = _float_fmt(objekt)
+        else:
+            out = objekt
+    return out, out
+
+
+@lru_cache(maxsize=None)
+def _nipype_config():
+    """Memoized handle on the nipype configuration object."""
+    from nipype import config
+
+    return config
+
+
+@lru_cache(maxsize=None)
+def _parse_ver(version_str):
+    """Parse a version string once, preferring PEP 440 semantics.
+
+    Tool versions that do not follow PEP 440 fall back to the legacy
+    LooseVersion; comparing the two types raises TypeError, which the
+    scan below reports as an unverifiable requirement.
+    """
+    try:
+        return Version(version_str)
+    except InvalidVersion:
+        from nipype import LooseVersion
+
+        return LooseVersion(version_str)
+
+
+def _scan_versioned_traits(trait_object, version_str):
+    """Classify ``min_ver``/``max_ver`` traits against ``version_str``."""
+    version = _parse_ver(version_str)
+    too_old = []
+    too_new = []
+    unknown = []
+    # A single walk over the trait table replaces one filtered
+    # trait_names() call plus a traits()[name] lookup per bound
+    for name, trait in trait_object.traits().items():
+        if trait.min_ver is not None:
+            min_ver = _parse_ver(str(trait.min_ver))
+            try:
+                if min_ver > version:
+                    too_old.append((name, str(min_ver)))
+            except TypeError:
+                unknown.append((name, ">=", str(min_ver)))
+        if trait.max_ver is not None:
+            max_ver = _parse_ver(str(trait.max_ver))
+            try:
+                if max_ver < version:
+                    too_new.append((name, str(max_ver)))
+            except TypeError:
+                unknown.append((name, "<=", str(max_ver)))
+    return tuple(too_old), tuple(too_new), tuple(unknown)
+
+
+@lru_cache(maxsize=None)
+def _has_version_bounds(spec_cls):
+    """True if any class-level trait declares ``min_ver``/``max_ver``."""
+    return any(
+        trait.min_ver is not None or trait.max_ver is not None
+        for trait in spec_cls().traits().values()
+    )
+
+
+@lru_cache(maxsize=None)
+def _version_violations(spec_cls, version_str):
+    """Memoized trait-version scan for one ``(spec class, version)`` pair.
+
+    The scan walks the trait metadata and parses a version object per
+    bound; neither depends on the instance, so the result is shared by
+    the many instances of an interface a workflow creates.
+    """
+    return _scan_versioned_traits(spec_cls(), version_str)
+
 
 def _check_version_requirements(obj, trait_object, permissive=False):
     """Raises an exception on version mismatch
@@ -512,6 +722,14 @@ def _check_version_requirements(obj, trait_object, permissive=False):
     This is currently only used in __init__ to silently identify unavailable
     traits.
     """
+    # Fast-reject the common case before touching obj.version, which may
+    # be an expensive property (e.g. spawning a subprocess or importing
+    # distribution metadata).
+    if not trait_object._has_dynamic_traits() and not _has_version_bounds(
+        type(trait_object)
+    ):
+        return []
+
     if not obj.version:
         # TODO: Raise error if versions are to be enforced and this one is unknown
         # if str2bool(config.get("execution", "stop_on_unknown_version")):
@@ -520,85 +738,60 @@ def _check_version_requirements(obj, trait_object, permissive=False):
         #     )
         return []
 
-    from nipype import config, LooseVersion
+    version_str = str(obj.version)
+    if trait_object._has_dynamic_traits():
+        # Dynamically added traits are invisible to the class-keyed cache
+        too_old, too_new, unknown = _scan_versioned_traits(trait_object, version_str)
+    else:
+        too_old, too_new, unknown = _version_violations(type(trait_object), version_str)
+
+    for name, op, bound in unknown:
+        msg = (
+            f"Nipype cannot validate the package version {version_str!r} for "
+            f"{obj.__class__.__name__}. Trait {name} requires version {op}{bound}."
+        )
+        if not permissive:
+            _iflogger.warning(f"{msg}. Please verify validity.")
+        if _nipype_config().getboolean("execution", "stop_on_unknown_version"):
+            raise ValueError(msg)
 
     unavailable_traits = []
-    # check minimum version
-    check = dict(min_ver=lambda t: t is not None)
-    names = trait_object.trait_names(**check)
-
-    if names and obj.version:
-        version = LooseVersion(str(obj.version))
-        for name in names:
-            min_ver = LooseVersion(str(trait_object.traits()[name].min_ver))
-            try:
-                too_old = min_ver > version
-            except TypeError as err:
-                msg = (
-                    f"Nipype cannot validate the package version {version!r} for "
-                    f"{obj.__class__.__name__}. Trait {name} requires version >={min_ver}."
-                )
-                if not permissive:
-                    _iflogger.warning(f"{msg}. Please verify validity.")
-                if config.getboolean("execution", "stop_on_unknown_version"):
-                    raise ValueError(msg) from err
-                continue
-            if too_old:
-                unavailable_traits.append(name)
-                if not isdefined(getattr(trait_object, name)):
-                    continue
-                if not permissive:
-                    raise Exception(
-                        "Trait %s (%s) (version %s < required %s)"
-                        % (name, obj.__class__.__name__, version, min_ver)
-                    )
-
-    # check maximum version
-    check = dict(max_ver=lambda t: t is not None)
-    names = trait_object.trait_names(**check)
-    if names and obj.version:
-        version = LooseVersion(str(obj.version))
-        for name in names:
-            max_ver = LooseVersion(str(trait_object.traits()[name].max_ver))
-            try:
-                too_new = max_ver < version
-            except TypeError as err:
-                msg = (
-                    f"Nipype cannot validate the package version {version!r} for "
-                    f"{obj.__class__.__name__}. Trait {name} requires version <={max_ver}."
-                )
-                if not permissive:
-                    _iflogger.warning(f"{msg}. Please verify validity.")
-                if config.getboolean("execution", "stop_on_unknown_version"):
-                    raise ValueError(msg) from err
-                continue
-            if too_new:
-                unavailable_traits.append(name)
-                if not isdefined(getattr(trait_object, name)):
-                    continue
-                if not permissive:
-                    raise Exception(
-                        "Trait %s (%s) (version %s > required %s)"
-                        % (name, obj.__class__.__name__, version, max_ver)
-                    )
+    for name, bound in too_old:
+        unavailable_traits.append(name)
+        if not permissive and isdefined(getattr(trait_object, name)):
+            raise Exception(
+                f"Trait {name} ({obj.__class__.__name__}) "
+                f"(version {version_str} < required {bound})"
+            )
+    for name, bound in too_new:
+        unavailable_traits.append(name)
+        if not permissive and isdefined(getattr(trait_object, name)):
+            raise Exception(
+                f"Trait {name} ({obj.__class__.__name__}) "
+                f"(version {version_str} > required {bound})"
+            )
     return unavailable_traits
 
+
 def load_inputs_from_json(obj, json_file, overwrite=True):
     """
     A convenient way to load pre-set inputs from a JSON file.
     """
 
     with open(json_file) as fhandle:
-        inputs_dict = json.load(fhandle)
+        inputs_dict = _loads(fhandle.read())
 
-    def_inputs = []
+    inputs = obj.inputs
+    new_inputs = inputs_dict.keys()
     if not overwrite:
-        def_inputs = list(obj.inputs.get_traitsfree().keys())
+        new_inputs = new_inputs - inputs.get_traitsfree().keys()
 
-    new_inputs = list(set(list(inputs_dict.keys())) - set(def_inputs))
+    # One trait-name set build beats a traits-aware hasattr per key, and
+    # only actual traits can be assigned (not arbitrary attributes)
+    known_traits = set(inputs.trait_names())
     for key in new_inputs:
-        if hasattr(obj.inputs, key):
-            setattr(obj.inputs, key, inputs_dict[key])
+        if key in known_traits:
+            setattr(inputs, key, inputs_dict[key])
 
 def save_inputs_to_json(obj, json_file):
     """
@@ -607,4 +800,25 @@ def save_inputs_to_json(obj, json_file):
     inputs = obj.inputs.get_traitsfree()
     _iflogger.debug("saving inputs %s", inputs)
     with open(json_file, "w") as fhandle:
-        json.dump(inputs, fhandle, indent=4, ensure_ascii=False)
\ No newline at end of file
+        fhandle.write(_dumps(inputs))
+
+
+def get_filecopy_info(cls):
+    """Provides information about file inputs to copy or link to cwd.
+
+    Necessary for pipeline operation
+    """
+    if cls.input_spec is None:
+        return None
+
+    is_cls = isclass(cls)
+    # normalize_filenames is not a classmethod, hence check instances only
+    if not is_cls:
+        normalize = getattr(cls, "normalize_filenames", None)
+        if normalize is not None:
+            normalize()
+    inputs = cls.input_spec() if is_cls else cls.inputs
+    return [
+        dict(key=name, copy=spec.copyfile)
+        for name, spec in sorted(inputs.traits(**_COPYFILE_FILTER).items())
+    ]
@@ -8,13 +8,15 @@ Miscellaneous tools to support Interface functionality
 
 """
 import os
+import sys
 import logging
+import time
+import traceback
 from contextlib import AbstractContextManager
 from copy import deepcopy
 from textwrap import wrap
 import re
 from datetime import datetime as dt
-from dateutil.parser import parse as parseutc
 import platform
 
 
@@ -22,11 +24,76 @@ _iflogger = logging.getLogger("nipype.interface")
 
 HELP_LINEWIDTH = 89
 
+_WS_RE = re.compile(r"\s+")
+
+
+class Runtime:
+    """Execution record of a single interface run.
+
+    A fixed-schema replacement for the anonymous ``Bunch`` previously
+    built by :class:`RuntimeContext`: ``__slots__`` keeps the thousands
+    of instances a workflow accumulates compact and makes attribute
+    access a slot-descriptor load.  Fields not touched by a run (e.g.
+    ``cmdline`` for pure-Python interfaces) read as ``None``.
+    """
+
+    __slots__ = (
+        "cmdline",
+        "command_path",
+        "cwd",
+        "dependencies",
+        "duration",
+        "endTime",
+        "environ",
+        "hostname",
+        "interface",
+        "merged",
+        "platform",
+        "prevcwd",
+        "redirect_x",
+        "returncode",
+        "startTime",
+        "stderr",
+        "stdout",
+        "success_codes",
+        "traceback",
+        "traceback_args",
+        "version",
+    )
+
+    def __init__(self, **fields):
+        # One write per slot: fields not provided get None directly
+        # instead of a blanket None pass overwritten by the kwargs
+        for name in self.__slots__:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(
+                "Runtime got unexpected fields: %s" % ", ".join(sorted(fields))
+            )
+
+    def items(self):
+        """Iterate over runtime fields as key, value pairs."""
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def dictcopy(self):
+        """Return a deep copy of the runtime record as a dictionary."""
+        return deepcopy({name: getattr(self, name) for name in self.__slots__})
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Runtime({fields})"
+
 
 class RuntimeContext(AbstractContextManager):
     """A context manager to run NiPype interfaces."""
 
-    __slots__ = ("_runtime", "_ignore_exc")
+    __slots__ = ("_runtime", "_ignore_exc", "_t0")
+
+    # Host-invariant values, resolved once at import time.
+    # platform.platform() in particular may shell out to uname.  Kept as
+    # class attributes so tests can override them.
+    _hostname = platform.node()
+    _platform = platform.platform()
 
     def __init__(self, ignore_exception=False):
         """Initialize the context manager object."""
@@ -41,15 +108,19 @@ class RuntimeContext(AbstractContextManager):
         if cwd is None:
             cwd = _syscwd
 
-        self._runtime = Bunch(
-            cwd=str(cwd),
+        # Thousands of runs typically share a handful of working
+        # directories; interning collapses the copies to one object each
+        self._runtime = Runtime(
+            cwd=sys.intern(str(cwd)),
             duration=None,
             endTime=None,
-            environ=deepcopy(dict(os.environ)),
-            hostname=platform.node(),
+            # Environment values are immutable strings, so a shallow copy
+            # isolates the runtime from os.environ just as well
+            environ=dict(os.environ),
+            hostname=self._hostname,
             interface=interface.__class__.__name__,
-            platform=platform.platform(),
-            prevcwd=str(_syscwd),
+            platform=self._platform,
+            prevcwd=sys.intern(str(_syscwd)),
             redirect_x=redirect_x,
             returncode=None,
             startTime=None,
@@ -63,6 +134,9 @@ class RuntimeContext(AbstractContextManager):
         # if self._runtime.redirect_x:
         #     self._runtime.environ["DISPLAY"] = config.get_display()
 
+        # duration is measured on the monotonic clock; the wall-clock
+        # strings are only for display and provenance
+        self._t0 = time.perf_counter()
         self._runtime.startTime = dt.isoformat(dt.utcnow())
         # TODO: Perhaps clean-up path and ensure it exists?
         os.chdir(self._runtime.cwd)
@@ -71,32 +145,28 @@ class RuntimeContext(AbstractContextManager):
     def __exit__(self, exc_type, exc_value, exc_tb):
         """Tear-down interface execution."""
         self._runtime.endTime = dt.isoformat(dt.utcnow())
-        timediff = parseutc(self._runtime.endTime) - parseutc(self._runtime.startTime)
-        self._runtime.duration = (
-            timediff.days * 86400 + timediff.seconds + timediff.microseconds / 1e6
-        )
+        self._runtime.duration = time.perf_counter() - self._t0
 
         os.chdir(self._runtime.prevcwd)
 
         if exc_type is not None or exc_value is not None or exc_tb is not None:
-            import traceback
-
             # Retrieve the maximum info fast
             self._runtime.traceback = "".join(
                 traceback.format_exception(exc_type, exc_value, exc_tb)
             )
             # Gather up the exception arguments and append nipype info.
-            exc_args = exc_value.args if getattr(exc_value, "args") else tuple()
+            exc_args = exc_value.args or ()
             exc_args += (
                 f"An exception of type {exc_type.__name__} occurred while "
                 f"running interface {self._runtime.interface}.",
             )
-            self._runtime.traceback_args = ("\n".join([f"{arg}" for arg in exc_args]),)
+            self._runtime.traceback_args = ("\n".join(map(str, exc_args)),)
 
             if self._ignore_exc:
                 return True
 
-        if hasattr(self._runtime, "cmdline"):
+        # Only command-line runs populate cmdline (all Runtime fields exist)
+        if self._runtime.cmdline is not None:
             retcode = self._runtime.returncode
             if retcode not in self._runtime.success_codes:
                 self._runtime.traceback = (
@@ -181,22 +251,16 @@ class Bunch(object):
         needs setting or not. Till that mechanism changes, only alter
         this after careful consideration.
         """
-        outstr = ["Bunch("]
-        first = True
-        for k, v in sorted(self.items()):
-            if not first:
-                outstr.append(", ")
+        parts = []
+        for k, v in sorted(self.__dict__.items()):
             if isinstance(v, dict):
-                pairs = []
-                for key, value in sorted(v.items()):
-                    pairs.append("'%s': %s" % (key, value))
-                v = "{" + ", ".join(pairs) + "}"
-                outstr.append("%s=%s" % (k, v))
+                inner = ", ".join(
+                    f"'{key}': {value}" for key, value in sorted(v.items())
+                )
+                parts.append(f"{k}={{{inner}}}")
             else:
-                outstr.append("%s=%r" % (k, v))
-            first = False
-        outstr.append(")")
-        return "".join(outstr)
+                parts.append(f"{k}={v!r}")
+        return "Bunch({})".format(", ".join(parts))
 
     def _get_bunch_hash(self):
         """Return a dictionary of our items with hashes for each file.
@@ -222,7 +286,7 @@ class Bunch(object):
         from nipype.utils.filemanip import md5
 
         infile_list = []
-        for key, val in list(self.items()):
+        for key, val in self.items():
             if is_container(val):
                 # XXX - SG this probably doesn't catch numpy arrays
                 # containing embedded file names either.
@@ -335,25 +399,35 @@ def format_help(cls):
     For complete details, ...
 
     """
-    from ...utils.misc import trim
-
-    docstring = []
+    # The help text derives from class-level attributes only, so cache it
+    # on the class itself; __dict__ lookup keeps subclasses from
+    # inheriting a parent's rendered help
+    cached = cls.__dict__.get("_cached_help")
+    if cached is not None:
+        return cached
+
+    from nipype.utils.misc import trim
+
+    # One list, appended in place; repeated list concatenation would
+    # allocate a fresh copy per section
+    parts = []
     cmd = getattr(cls, "_cmd", None)
     if cmd:
-        docstring += ["Wraps the executable command ``%s``." % cmd, ""]
+        parts.extend(["Wraps the executable command ``%s``." % cmd, ""])
 
     if cls.__doc__:
-        docstring += trim(cls.__doc__).split("\n") + [""]
-
-    allhelp = "\n".join(
-        docstring
-        + _inputs_help(cls)
-        + [""]
-        + _outputs_help(cls)
-        + [""]
-        + _refs_help(cls)
-    )
-    return allhelp.expandtabs(8)
+        parts.extend(trim(cls.__doc__).split("\n"))
+        parts.append("")
+
+    parts.extend(_inputs_help(cls))
+    parts.append("")
+    parts.extend(_outputs_help(cls))
+    parts.append("")
+    parts.extend(_refs_help(cls))
+
+    allhelp = "\n".join(parts)
+    cls._cached_help = allhelp = allhelp.expandtabs(8)
+    return allhelp
 
 
 def _inputs_help(cls):
@@ -366,28 +440,30 @@ def _inputs_help(cls):
 
     """
     helpstr = ["Inputs::"]
-    mandatory_keys = []
+    mandatory_items = []
     optional_items = []
 
     if cls.input_spec:
         inputs = cls.input_spec()
-        mandatory_items = list(inputs.traits(mandatory=True).items())
+        # One filtered walk, partitioned locally, replaces separate
+        # mandatory=True and transient=None scans over the trait table
+        for name, spec in inputs.traits(transient=None).items():
+            if spec.mandatory:
+                mandatory_items.append((name, spec))
+            else:
+                optional_items.append("\n".join(get_trait_desc(inputs, name, spec)))
+
         if mandatory_items:
-            helpstr += ["", "\t[Mandatory]"]
+            helpstr.extend(["", "\t[Mandatory]"])
             for name, spec in mandatory_items:
-                helpstr += get_trait_desc(inputs, name, spec)
+                helpstr.extend(get_trait_desc(inputs, name, spec))
 
-        mandatory_keys = {item[0] for item in mandatory_items}
-        optional_items = [
-            "\n".join(get_trait_desc(inputs, name, val))
-            for name, val in inputs.traits(transient=None).items()
-            if name not in mandatory_keys
-        ]
         if optional_items:
-            helpstr += ["", "\t[Optional]"] + optional_items
+            helpstr.extend(["", "\t[Optional]"])
+            helpstr.extend(optional_items)
 
-    if not mandatory_keys and not optional_items:
-        helpstr += ["", "\tNone"]
+    if not mandatory_items and not optional_items:
+        helpstr.extend(["", "\tNone"])
     return helpstr
 
 
@@ -400,15 +476,15 @@ def _outputs_help(cls):
     ['Outputs::', '', '\tout: (a float)\n\t\tglobal correlation value']
 
     """
-    helpstr = ["Outputs::", "", "\tNone"]
+    helpstr = ["Outputs::", ""]
+    outhelpstr = []
     if cls.output_spec:
         outputs = cls.output_spec()
         outhelpstr = [
             "\n".join(get_trait_desc(outputs, name, spec))
             for name, spec in outputs.traits(transient=None).items()
         ]
-        if outhelpstr:
-            helpstr = helpstr[:-1] + outhelpstr
+    helpstr.extend(outhelpstr or ["\tNone"])
     return helpstr
 
 
@@ -419,12 +495,36 @@ def _refs_help(cls):
         return []
 
     helpstr = ["References:", "-----------"]
-    for r in references:
-        helpstr += ["{}".format(r["entry"])]
-
+    helpstr.extend("{}".format(r["entry"]) for r in references)
     return helpstr
 
 
+def _wrap(line, initial_indent, subsequent_indent):
+    """``textwrap.wrap`` with a fast path for lines that already fit.
+
+    Short lines with no embedded whitespace oddities — the common case
+    for trait descriptions — skip the TextWrapper construction and
+    tokenization entirely.  The guards keep the output identical to
+    wrap() for anything it would normalize (blank lines, tabs, edge
+    whitespace).
+    """
+    if (
+        line
+        and len(line) + len(initial_indent) <= HELP_LINEWIDTH
+        and not line[0].isspace()
+        and not line[-1].isspace()
+        and "\t" not in line
+        and "\n" not in line
+    ):
+        return [initial_indent + line]
+    return wrap(
+        line,
+        HELP_LINEWIDTH,
+        initial_indent=initial_indent,
+        subsequent_indent=subsequent_indent,
+    )
+
+
 def get_trait_desc(inputs, name, spec):
     """Parses a HasTraits object into a nipype documentation string"""
     desc = spec.desc
@@ -432,8 +532,6 @@ def get_trait_desc(inputs, name, spec):
     requires = spec.requires
     argstr = spec.argstr
 
-    manhelpstr = ["\t%s" % name]
-
     type_info = spec.full_info(inputs, name, None)
 
     default = ""
@@ -441,53 +539,26 @@ def get_trait_desc(inputs, name, spec):
         default = ", nipype default value: %s" % str(spec.default_value()[1])
     line = "(%s%s)" % (type_info, default)
 
-    manhelpstr = wrap(
-        line,
-        HELP_LINEWIDTH,
-        initial_indent=manhelpstr[0] + ": ",
-        subsequent_indent="\t\t  ",
-    )
+    manhelpstr = _wrap(line, "\t%s: " % name, "\t\t  ")
 
     if desc:
         for line in desc.split("\n"):
-            line = re.sub(r"\s+", " ", line)
-            manhelpstr += wrap(
-                line, HELP_LINEWIDTH, initial_indent="\t\t", subsequent_indent="\t\t"
-            )
+            line = _WS_RE.sub(" ", line)
+            manhelpstr += _wrap(line, "\t\t", "\t\t")
 
     if argstr:
         pos = spec.position
         if pos is not None:
-            manhelpstr += wrap(
-                "argument: ``%s``, position: %s" % (argstr, pos),
-                HELP_LINEWIDTH,
-                initial_indent="\t\t",
-                subsequent_indent="\t\t",
+            manhelpstr += _wrap(
+                "argument: ``%s``, position: %s" % (argstr, pos), "\t\t", "\t\t"
             )
         else:
-            manhelpstr += wrap(
-                "argument: ``%s``" % argstr,
-                HELP_LINEWIDTH,
-                initial_indent="\t\t",
-                subsequent_indent="\t\t",
-            )
+            manhelpstr += _wrap("argument: ``%s``" % argstr, "\t\t", "\t\t")
 
     if xor:
-        line = "%s" % ", ".join(xor)
-        manhelpstr += wrap(
-            line,
-            HELP_LINEWIDTH,
-            initial_indent="\t\tmutually_exclusive: ",
-            subsequent_indent="\t\t  ",
-        )
+        manhelpstr += _wrap(", ".join(xor), "\t\tmutually_exclusive: ", "\t\t  ")
 
     if requires:
         others = [field for field in requires if field != name]
-        line = "%s" % ", ".join(others)
-        manhelpstr += wrap(
-            line,
-            HELP_LINEWIDTH,
-            initial_indent="\t\trequires: ",
-            subsequent_indent="\t\t  ",
-        )
+        manhelpstr += _wrap(", ".join(others), "\t\trequires: ", "\t\t  ")
     return manhelpstr
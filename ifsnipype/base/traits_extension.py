@@ -372,8 +372,10 @@ Unknown value(s) %s for metadata type of an ImageFile input.\
         )
 
 
-def isdefined(objekt):
-    return not isinstance(objekt, _Undefined)
+def isdefined(objekt, _undefined=_Undefined):
+    # _undefined is bound at definition time to skip a global lookup in
+    # what is the most frequently called function in the package
+    return not isinstance(objekt, _undefined)
 
 
 def has_metadata(trait, metadata, value=None, recursive=True):
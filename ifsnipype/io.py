@@ -2739,12 +2739,12 @@ class JSONFileGrabber(IOBase):
     _always_run = True
 
     def _list_outputs(self):
-        import simplejson
+        import json
 
         outputs = {}
         if isdefined(self.inputs.in_file):
             with open(self.inputs.in_file, "r") as f:
-                data = simplejson.load(f)
+                data = json.load(f)
 
             if not isinstance(data, dict):
                 raise RuntimeError("JSON input has no dictionary structure")
@@ -2839,7 +2839,7 @@ class JSONFileSink(IOBase):
         return name, val
 
     def _list_outputs(self):
-        import simplejson
+        import json
         import os.path as op
 
         if not isdefined(self.inputs.out_file):
@@ -2857,7 +2857,7 @@ class JSONFileSink(IOBase):
             out_dict[key] = val
 
         with open(out_file, "w") as f:
-            f.write(str(simplejson.dumps(out_dict, ensure_ascii=False)))
+            f.write(json.dumps(out_dict, ensure_ascii=False))
 
         outputs = self.output_spec().get()
         outputs["out_file"] = out_file